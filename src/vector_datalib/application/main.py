@@ -4,7 +4,7 @@ Delegates all operations to service layer following clean architecture.
 Async-first design for non-blocking I/O operations.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Callable, Optional, List
 
 import asyncio
 import logging
@@ -20,6 +20,25 @@ from ..infrastructure.storage import VectorFileStorage
 logger = logging.getLogger(__name__)
 
 
+def _validate_upsert(attributes: Any, position: Any):
+    """
+    Full upsert argument validation, reached only when the fast exact-type check fails.
+
+    Raises:
+        TypeError: If attributes is not a dict or position is not an int
+        ValueError: If attributes is empty
+    """
+
+    if not isinstance(attributes, dict):
+        raise TypeError(f"Attributes must be dict, got {type(attributes).__name__}")
+
+    if not attributes:
+        raise ValueError("Attributes dictionary cannot be empty")
+
+    if position is not None and not isinstance(position, int):
+        raise TypeError(f"Position must be int or None, got {type(position).__name__}")
+
+
 class VectorDB:
     """
     Vector Database - Coordinate-based database system with async-first API.
@@ -70,7 +89,7 @@ class VectorDB:
                 await self.__coordinate_service.load_database_structure()
                 self.__initialized = True
 
-            logger.info(f"VectorDB initialized with {self.__central_axis.size()} vector points")
+            logger.info("VectorDB initialized with %d vector points", self.__central_axis.size())
             return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -82,7 +101,7 @@ class VectorDB:
                 await self.__coordinate_service.save_database()
 
             except Exception as e:
-                logger.error(f"Error saving database on exit: {e}")
+                logger.error("Error saving database on exit: %s", e)
                 raise
 
             finally:
@@ -99,14 +118,9 @@ class VectorDB:
     async def upsert(self, vector_value: Any, attributes: Dict[str, Any], position: Optional[int] = None) -> int:
         """Smart upsert: inserts if new, updates all attributes if exists."""
 
-        if not isinstance(attributes, dict):
-            raise TypeError(f"Attributes must be dict, got {type(attributes).__name__}")
-
-        if not attributes:
-            raise ValueError("Attributes dictionary cannot be empty")
-
-        if position is not None and not isinstance(position, int):
-            raise TypeError(f"Position must be int or None, got {type(position).__name__}")
+        # Exact-type fast path for the common shape - subclasses and errors take the slow path
+        if type(attributes) is not dict or not attributes or (position is not None and type(position) is not int):
+            _validate_upsert(attributes, position)
 
         self._check_closed()
         return await self.__coordinate_service.upsert_with_attributes(vector_value, attributes, position)
@@ -117,11 +131,39 @@ class VectorDB:
         if not isinstance(dimension_name, str):
             raise TypeError(f"Dimension name must be str, got {type(dimension_name).__name__}")
 
-        self._check_closed()
+        # Inlined _check_closed - saves a method call on the hottest read path
+        if self.__closed:
+            self._check_closed()
+
         return await self.__coordinate_service.lookup_by_coordinate(vector_value, dimension_name)
 
+    def compile_lookup(self, dimension_name: str) -> Callable[[Any], Optional[Any]]:
+        """
+        Get a specialized synchronous lookup function for one dimension.
+        Skips the async cache layer - intended for hot loops querying the same dimension.
+
+        Usage:
+            lookup_age = db.compile_lookup("age")
+            ages = [lookup_age(key) for key in keys]
+
+        Args:
+            dimension_name: The dimension the returned function reads from
+
+        Returns:
+            Callable: Function mapping a vector value to its value in that dimension (or None)
+        """
+
+        if not isinstance(dimension_name, str):
+            raise TypeError(f"Dimension name must be str, got {type(dimension_name).__name__}")
+
+        self._check_closed()
+        return self.__coordinate_service.compile_lookup(dimension_name)
+
     async def save(self) -> bool:
-        """Save the database to file."""
+        """
+        Save the database to file.
+        Appends changes since the last save to the write-ahead log, rewriting the snapshot once the log grows large.
+        """
 
         if self.__lock is None:
             raise RuntimeError("save() requires using 'async with' context manager")
@@ -131,35 +173,41 @@ class VectorDB:
             return await self.__coordinate_service.save_database()
 
     async def batch_upsert(self, records: List[tuple]) -> List[int]:
-        """Batch upsert vector points concurrently (insert or update)."""
+        """
+        Batch upsert vector points (insert or update) in record order.
+        Records are applied in this coroutine without a task per record; runs of new points
+        are added to the central axis in bulk.
+        """
         self._check_closed()
 
-        async def _upsert_single(record):
-            if len(record) == 2:
-                vector_value, attributes = record
-                position = None
-            elif len(record) == 3:
-                vector_value, attributes, position = record
-            else:
-                raise ValueError(
-                    "Each record must be (vector_value, attributes) or (vector_value, attributes, position)"
-                )
+        def _normalize():
+            for record in records:
+                if len(record) == 2:
+                    vector_value, attributes, position = record[0], record[1], None
+                elif len(record) == 3:
+                    vector_value, attributes, position = record
+                else:
+                    raise ValueError(
+                        "Each record must be (vector_value, attributes) or (vector_value, attributes, position)"
+                    )
 
-            return await self.__coordinate_service.upsert_with_attributes(vector_value, attributes, position)
+                # Checked before the record is queued - a bad record stops the batch before it touches the axis
+                if not isinstance(attributes, dict):
+                    raise TypeError(f"Attributes must be dict, got {type(attributes).__name__}")
 
-        tasks = [_upsert_single(record) for record in records]
-        coordinates = await asyncio.gather(*tasks)
-        return list(coordinates)
+                if position is not None and not isinstance(position, int):
+                    raise TypeError(f"Position must be int or None, got {type(position).__name__}")
+
+                yield vector_value, attributes, position
+
+        # Streamed to the service - no normalized copy of the whole batch is kept alive
+        return await self.__coordinate_service.batch_upsert_with_attributes(_normalize())
 
     async def batch_lookup(self, queries: List[tuple]) -> List[Optional[Any]]:
-        """Perform multiple lookups concurrently."""
+        """Perform multiple lookups in a single pass over the domain objects."""
         self._check_closed()
 
-        tasks = [
-            self.__coordinate_service.lookup_by_coordinate(vector_value, dimension_name)
-            for vector_value, dimension_name in queries
-        ]
-        return await asyncio.gather(*tasks)
+        return self.__coordinate_service.batch_lookup_by_coordinate(queries)
 
     async def delete(self, vector_value: Any) -> bool:
         """
@@ -190,7 +238,7 @@ class VectorDB:
             try:
                 return await self.__coordinate_service.delete_coordinate(vector_value)
             except Exception as e:
-                logger.warning(f"Failed to delete {vector_value} - {e}")
+                logger.warning("Failed to delete %s - %s", vector_value, e)
                 return False
 
         tasks = [_delete_single(vector_value) for vector_value in vector_values]
@@ -204,12 +252,18 @@ class VectorDB:
         return self.__coordinate_service.get_database_statistics()
 
     def get_vector_point(self, vector_value: Any):
-        """Get complete vector point with all its dimensional attributes."""
+        """
+        Get complete vector point with all its dimensional attributes.
+        Reads the domain objects directly - never fills or evicts lookup cache entries.
+        """
 
         return self.__coordinate_service.get_vector_point_complete(vector_value)
 
     def get_all_vector_points(self) -> List:
-        """Get all vector points with their complete attribute sets."""
+        """
+        Get all vector points with their complete attribute sets.
+        A full scan bypasses the lookup cache, so it cannot flush entries that serve regular lookups.
+        """
 
         return self.__coordinate_service.get_all_vector_points_complete()
 
@@ -220,13 +274,19 @@ class VectorDB:
 
     @property
     def vector_count(self) -> int:
-        """Get the number of vector points in the database"""
+        """
+        Get the number of vector points in the database.
+        Lock-free O(1) read - a point-in-time snapshot under concurrent writers.
+        """
 
         return self.__central_axis.size()
 
     @property
     def dimension_count(self) -> int:
-        """Get the number of dimensions in the database"""
+        """
+        Get the number of dimensions in the database.
+        Lock-free O(1) read - a point-in-time snapshot under concurrent writers.
+        """
 
         return len(self.__dimensional_spaces)
 
@@ -1,35 +1,45 @@
 """
-Cache Service - Handles async-safe LRU caching for Vector Database lookups.
+Cache Service - Handles async-safe CLOCK caching for Vector Database lookups.
 Follows DDD separation of concerns.
 """
 
-from typing import Any, Optional, Dict
-from collections import OrderedDict
+from typing import Any, Hashable, Optional, Dict, List
 
 import logging
-import asyncio
 
 logger = logging.getLogger(__name__)
 
+_EMPTY = object()  # Marks a cache slot freed by invalidation
+
 
 class CacheService:
-    """Async-safe LRU cache service for database lookups."""
+    """
+    Async-safe CLOCK (second-chance) cache service for database lookups.
+    Approximates LRU: a hit only sets a reference bit, eviction sweeps a hand over the slots.
+    """
 
     def __init__(self, max_size: int = 1000):
         """
-        Initialize LRU cache with configurable size.
+        Initialize CLOCK cache with configurable size.
 
         Args:
             max_size: Maximum number of items to cache
         """
 
-        self._cache: OrderedDict[str, Any] = OrderedDict()
+        self._index: Dict[Hashable, int] = {}  # key -> slot
+        self._keys: List[Any] = []
+        self._values: List[Any] = []
+        self._referenced = bytearray()  # One reference bit (byte) per slot
+        self._free: List[int] = []  # Slots freed by invalidation, reused before evicting
+        self._hand = 0
+
         self._max_size = max_size
-        self._lock = asyncio.Lock()
 
-    async def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: Hashable) -> Optional[Any]:
         """
-        Get value from cache, moving it to end (most recently used).
+        Get value from cache, marking its slot as recently referenced.
+        No lock: the body has no await points, so it runs atomically
+        on the event loop and cannot observe a half-applied write.
 
         Args:
             key: Cache key
@@ -38,64 +48,138 @@ class CacheService:
             Cached value or None if not found
         """
 
-        async with self._lock:
-            if key in self._cache:
-                # Move to end (most recently used)
-                self._cache.move_to_end(key)
-                return self._cache[key]
+        return self.get_nowait(key)
+
+    def get_nowait(self, key: Hashable) -> Optional[Any]:
+        """
+        Get value from cache without scheduling a coroutine (sync - used on the hot lookup path).
 
-        return None
+        Args:
+            key: Cache key
 
-    async def put(self, key: str, value: Any):
+        Returns:
+            Cached value or None if not found
         """
-        Add item to LRU cache, evicting oldest if at capacity.
+
+        slot = self._index.get(key)
+        if slot is None:
+            return None
+
+        # Second chance - no reordering on hit
+        self._referenced[slot] = 1
+        return self._values[slot]
+
+    async def put(self, key: Hashable, value: Any):
+        """
+        Add item to CLOCK cache, evicting an unreferenced slot if at capacity.
+        No lock: like reads, the body has no await points and runs atomically on the event loop.
 
         Args:
             key: Cache key
             value: Value to cache
         """
 
-        async with self._lock:
-            # If key exists, move to end; otherwise add new
-            if key in self._cache:
-                self._cache.move_to_end(key)
+        slot = self._index.get(key)
+
+        # If key exists, refresh in place; otherwise take a slot
+        if slot is not None:
+            self._values[slot] = value
+            self._referenced[slot] = 1
+            return
+
+        if self._max_size <= 0:
+            return
+
+        if self._free:
+            slot = self._free.pop()
 
-            self._cache[key] = value
+        elif len(self._keys) < self._max_size:
+            slot = len(self._keys)
 
-            # Evict oldest if over capacity
-            if len(self._cache) > self._max_size:
-                self._cache.popitem(last=False)
+            self._keys.append(_EMPTY)
+            self._values.append(None)
+            self._referenced.append(0)
 
-    async def invalidate(self, key: str):
+        else:
+            slot = self._evict()
+
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._referenced[slot] = 0
+        self._index[key] = slot
+
+    def _evict(self) -> int:
+        """
+        Advance the clock hand, clearing reference bits, until an unreferenced slot is found.
+        The sweep is a C-level find on the reference bytes plus one slice clear, not a per-slot loop.
+        """
+
+        referenced = self._referenced
+        start = self._hand
+        hand = referenced.find(0, start)
+
+        if hand >= 0:
+            referenced[start:hand] = bytes(hand - start)
+
+        else:
+            # Wrap around - every slot from the hand on gets its second chance
+            referenced[start:] = bytes(len(referenced) - start)
+            hand = referenced.find(0, 0, start)
+
+            if hand < 0:
+                # Everything was referenced - the sweep comes back to where it started
+                referenced[:start] = bytes(start)
+                hand = start
+
+            else:
+                referenced[:hand] = bytes(hand)
+
+        del self._index[self._keys[hand]]
+        self._hand = (hand + 1) % len(self._keys)
+
+        return hand
+
+    async def invalidate(self, key: Hashable):
         """
         Remove a specific key from cache.
 
         Args:
             key: Cache key to invalidate
         """
-        async with self._lock:
-            self._cache.pop(key, None)
+        slot = self._index.pop(key, None)
+
+        if slot is not None:
+            self._keys[slot] = _EMPTY
+            self._values[slot] = None
+            self._referenced[slot] = 0
+            self._free.append(slot)
 
     def clear(self):
         """Clear all cached items (sync - used in cleanup)."""
-        self._cache.clear()
+
+        self._index.clear()
+        self._keys.clear()
+        self._values.clear()
+        self._referenced.clear()
+        self._free.clear()
+        self._hand = 0
 
     def size(self) -> int:
         """Get current cache size."""
-        return len(self._cache)
+        return len(self._index)
 
     def is_full(self) -> bool:
         """Check if cache is at maximum capacity."""
-        return len(self._cache) >= self._max_size
+        return len(self._index) >= self._max_size
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
 
         return {
-            "current_size": len(self._cache),
+            "current_size": len(self._index),
             "max_size": self._max_size,
-            "utilization": len(self._cache) / self._max_size * 100,
+            "utilization": len(self._index) / self._max_size * 100,
         }
 
     def __repr__(self) -> str:
-        return f"CacheService(size={len(self._cache)}/{self._max_size}, {len(self._cache) / self._max_size * 100:.1f}% full)"
+        return f"CacheService(size={len(self._index)}/{self._max_size}, {len(self._index) / self._max_size * 100:.1f}% full)"
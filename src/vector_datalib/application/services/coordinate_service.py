@@ -3,16 +3,36 @@ Coordinate Service - Orchestrates operations between domain objects.
 Follows DDD principles by coordinating domain logic without containing business rules.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Callable, Iterable, Optional, List, Tuple
+from collections import Counter
 
 import logging
 import asyncio
+import sys
 
 from ...domain.spaces import DimensionalSpace
+from ...domain.spaces.dimensional_space import PLAIN_VALUE_TYPES, check_storable
 from ...domain.mappings import CoordinateMapping
 
 logger = logging.getLogger(__name__)
 
+# Write-ahead log operation kinds
+OP_UPSERT = "upsert"
+OP_DELETE = "delete"
+
+
+def _int_keys(data: Dict[Any, Any]) -> Dict[int, Any]:
+    """Coerce map keys to int for the older mapping formats - the loop runs inside C-level map/zip/dict."""
+    return dict(zip(map(int, data), data.values()))
+
+
+def _check_attribute_values(attributes: Dict[str, Any]):
+    """Reject attribute values storage can't serialize before the upsert mutates anything (TypeError)."""
+
+    for value in attributes.values():
+        if type(value) not in PLAIN_VALUE_TYPES:
+            check_storable(value)
+
 
 class CoordinateService:
     """Service layer that orchestrates coordinate operations between domain objects."""
@@ -26,7 +46,7 @@ class CoordinateService:
             dimensional_spaces: Dict of DimensionalSpace objects
             coordinate_mappings: Dict of CoordinateMapping objects
             storage: VectorFileStorage infrastructure
-            cache_service: CacheService for LRU caching
+            cache_service: CacheService for CLOCK caching
         """
 
         self.central_axis = central_axis
@@ -35,6 +55,21 @@ class CoordinateService:
         self.storage = storage
         self.cache_service = cache_service
 
+        # dimension name -> (space, mapping), so lookups resolve a dimension with a single probe
+        self._resolved_dimensions: Dict[str, Tuple[DimensionalSpace, CoordinateMapping]] = {}
+
+        # Dimension names in creation order, rebuilt only after the set of dimensions changes
+        self._dimension_names: Optional[Tuple[str, ...]] = None
+
+        # Operations applied since the last save, appended to the write-ahead log on the next save
+        self._pending_ops: List[list] = []
+
+        # Operations are recorded once a snapshot exists or is being written - before that, every save is a full one
+        self._record_ops = False
+
+        # Set only once a snapshot has been loaded or committed - the log and the "nothing to save" check build on it
+        self._has_snapshot = False
+
     async def upsert_with_attributes(
         self, vector_value: Any, attributes: Dict[str, Any], position: Optional[int] = None
     ) -> int:
@@ -51,98 +86,265 @@ class CoordinateService:
 
         Returns:
             int: The coordinate of the vector point
+
+        Raises:
+            TypeError: If an attribute value can't be serialized by storage
         """
 
+        _check_attribute_values(attributes)
         existing_coordinate = self.central_axis.get_coordinate(vector_value)
 
         if existing_coordinate is not None:
-            logger.debug(f"Updating existing vector point '{vector_value}' at coordinate {existing_coordinate}")
+            logger.debug("Updating existing vector point '%s' at coordinate %d", vector_value, existing_coordinate)
 
-            # Update all provided attributes
+            resolved_dimensions = self._resolved_dimensions
+
+            # Update all provided attributes - one probe resolves both the space and the mapping
             for dimension_name, value in attributes.items():
-                # Ensure dimension exists
-                if dimension_name not in self.dimensional_spaces:
-                    self._add_dimension(dimension_name)
+                space, mapping = resolved_dimensions.get(dimension_name) or self._ensure_dimension(dimension_name)
 
                 # Get old value_id for this coordinate
-                old_value_id = self.coordinate_mappings[dimension_name].get_mapping(existing_coordinate)
+                old_value_id = mapping.get_mapping(existing_coordinate)
 
-                # Get or add new value
-                new_value_id = self.dimensional_spaces[dimension_name].get_value_id(value)
-                if new_value_id is None:
-                    new_value_id = self.dimensional_spaces[dimension_name].add_value(value)
+                # Get or add new value (add_value returns the existing ID for a known value)
+                new_value_id = space.add_value(value)
 
                 # Update mapping
-                self.coordinate_mappings[dimension_name].set_mapping(existing_coordinate, new_value_id)
+                mapping.set_mapping(existing_coordinate, new_value_id)
 
                 # Clean up old value if unreferenced
                 if old_value_id is not None and old_value_id != new_value_id:
-                    ref_count = self.coordinate_mappings[dimension_name].count_references_to_value(old_value_id)
-                    if ref_count == 0:
-                        self.dimensional_spaces[dimension_name].remove_value_if_unused(old_value_id)
+                    if mapping.count_references_to_value(old_value_id) == 0:
+                        space.remove_value_if_unused(old_value_id)
 
                 # Invalidate cache
-                cache_key = f"{vector_value}:{dimension_name}"
+                cache_key = (vector_value, dimension_name)
                 await self.cache_service.invalidate(cache_key)
 
+            if self._record_ops:
+                self._pending_ops.append([OP_UPSERT, vector_value, dict(attributes), None])
+
             return existing_coordinate
 
         else:
             # New insert
-            logger.debug(f"Inserting new vector point '{vector_value}'")
+            logger.debug("Inserting new vector point '%s'", vector_value)
 
             # Add to central axis
             coordinate = self.central_axis.add_vector_point(vector_value, position)
 
-            # Add dimensional attributes
-            for dimension_name, value in attributes.items():
-                if dimension_name not in self.dimensional_spaces:
-                    self._add_dimension(dimension_name)
+            # Handle position-based shifting before mapping the new coordinate
+            if position is not None:
+                self.central_axis.shift_coordinates_after_insertion(self.coordinate_mappings, coordinate, 1)
+
+            resolved_dimensions = self._resolved_dimensions
 
-                value_id = self.dimensional_spaces[dimension_name].add_value(value)
-                self.coordinate_mappings[dimension_name].set_mapping(coordinate, value_id)
+            # Add dimensional attributes - one probe resolves both the space and the mapping
+            for dimension_name, value in attributes.items():
+                space, mapping = resolved_dimensions.get(dimension_name) or self._ensure_dimension(dimension_name)
+                mapping.set_mapping(coordinate, space.add_value(value))
 
-            # Handle position-based shifting
-            if position is not None and position < coordinate:
-                self.central_axis.shift_coordinates_after_insertion(self.coordinate_mappings, position, 1)
+            if self._record_ops:
+                self._pending_ops.append([OP_UPSERT, vector_value, dict(attributes), position])
 
             return coordinate
 
+    async def batch_upsert_with_attributes(
+        self, records: Iterable[Tuple[Any, Dict[str, Any], Optional[int]]]
+    ) -> List[int]:
+        """
+        Upsert many (vector_value, attributes, position) records in order.
+        Runs of brand-new, unpositioned points are added to the central axis in one call and their
+        attributes filled dimension by dimension; updates and positional inserts take the single-record path.
+
+        Args:
+            records: (vector_value, attributes, position) tuples, consumed in a single pass
+
+        Returns:
+            List[int]: The coordinate of each record's vector point
+        """
+
+        get_coordinate = self.central_axis.get_coordinate
+        coordinates: List[int] = []
+
+        # Pending run of new points as parallel columns - no per-record container survives until the flush
+        run_values: List[Any] = []
+        run_attributes: List[Dict[str, Any]] = []
+        run_seen = set()
+
+        try:
+            for vector_value, attributes, position in records:
+                if position is None and vector_value not in run_seen and get_coordinate(vector_value) is None:
+                    _check_attribute_values(attributes)
+
+                    run_values.append(vector_value)
+                    run_attributes.append(attributes)
+                    run_seen.add(vector_value)
+                    continue
+
+                # Anything that depends on earlier records sees them applied first
+                values, attributes_list = run_values, run_attributes
+                run_values, run_attributes, run_seen = [], [], set()
+
+                coordinates.extend(self._insert_bulk(values, attributes_list))
+                coordinates.append(await self.upsert_with_attributes(vector_value, attributes, position))
+
+        finally:
+            # Records queued before a failing one are still applied and logged, as one-at-a-time upserts would be
+            coordinates.extend(self._insert_bulk(run_values, run_attributes))
+
+        return coordinates
+
+    def _insert_bulk(self, vector_values: List[Any], attributes_list: List[Dict[str, Any]]) -> List[int]:
+        """
+        Insert new, distinct, unpositioned vector points with one central axis call.
+        Internal method for batch upserts.
+        """
+
+        if not vector_values:
+            return []
+
+        coordinates = self.central_axis.add_vector_points_bulk(vector_values)
+
+        # dimension name -> (coordinates, values), gathered in record order
+        per_dimension: Dict[str, Tuple[List[int], List[Any]]] = {}
+
+        for coordinate, attributes in zip(coordinates, attributes_list):
+            for dimension_name, value in attributes.items():
+                cells = per_dimension.get(dimension_name)
+
+                if cells is None:
+                    cells = per_dimension[dimension_name] = ([], [])
+
+                cells[0].append(coordinate)
+                cells[1].append(value)
+
+        # One dimension resolution, one bulk value add and one bulk mapping write per dimension
+        for dimension_name, (cell_coordinates, values) in per_dimension.items():
+            space, mapping = self._resolved_dimensions.get(dimension_name) or self._ensure_dimension(dimension_name)
+            mapping.set_mappings(cell_coordinates, space.add_values(values))
+
+        # Logged once every mapping is written - the log never holds an operation that failed to apply
+        if self._record_ops:
+            self._pending_ops.extend(
+                [OP_UPSERT, vector_value, dict(attributes), None]
+                for vector_value, attributes in zip(vector_values, attributes_list)
+            )
+
+        return coordinates
+
     async def lookup_by_coordinate(self, vector_value: Any, dimension_name: str) -> Optional[Any]:
         """
         Look up a value for a vector point in a specific dimension.
-        O(1) lookup with async LRU caching coordination.
+        O(1) lookup with async CLOCK caching coordination.
         """
 
-        cache_key = f"{vector_value}:{dimension_name}"
-        cached_result = await self.cache_service.get(cache_key)
+        # Tuple key - hashed in C from the element hashes and unambiguous when values contain ':'
+        cache_key = (vector_value, dimension_name)
+
+        # Hits are served synchronously - no coroutine is created unless the result has to be cached
+        cached_result = self.cache_service.get_nowait(cache_key)
 
         if cached_result is not None:
             return cached_result
 
+        result = self._resolve_value(vector_value, dimension_name)
+
+        # Cache the result
+        if result is not None:
+            await self.cache_service.put(cache_key, result)
+
+        return result
+
+    def batch_lookup_by_coordinate(self, queries: List[tuple]) -> List[Optional[Any]]:
+        """
+        Look up many (vector_value, dimension_name) pairs in a single pass.
+        Resolves directly against the domain objects instead of scheduling one coroutine per query.
+        Each distinct dimension is resolved to its mapping and space once, outside the hot loop.
+        """
+
+        dimensions = {}
+
+        for dimension_name in {dimension_name for _, dimension_name in queries}:
+            resolved = self._resolved_dimensions.get(dimension_name)
+
+            if resolved is not None:
+                space, mapping = resolved
+                dimensions[dimension_name] = (mapping.get_mapping, space.get_value)
+
+        # The coordinate map's own C-level get - no Python frame per query for the central axis probe
+        get_coordinate = self.central_axis.coordinate_map.get
+        results = []
+        append = results.append
+
+        for vector_value, dimension_name in queries:
+            resolved = dimensions.get(dimension_name)
+            coordinate = get_coordinate(vector_value) if resolved is not None else None
+
+            if coordinate is None:
+                append(None)
+                continue
+
+            get_mapping, get_value = resolved
+            value_id = get_mapping(coordinate)
+
+            append(get_value(value_id) if value_id is not None else None)
+
+        return results
+
+    def compile_lookup(self, dimension_name: str) -> Callable[[Any], Optional[Any]]:
+        """
+        Build a specialized uncached lookup function for a single dimension.
+        Pre-binds the domain methods so each call is one function frame with no service-layer dispatch.
+        """
+
+        resolved = self._resolved_dimensions.get(dimension_name)
+
+        if resolved is None:
+            # Dimension doesn't exist yet - use the generic path so it is picked up once added
+            return lambda vector_value: self._resolve_value(vector_value, dimension_name)
+
+        space, mapping = resolved
+
+        get_coordinate = self.central_axis.get_coordinate
+        get_mapping = mapping.get_mapping
+        get_value = space.get_value
+
+        def lookup(vector_value: Any) -> Optional[Any]:
+            coordinate = get_coordinate(vector_value)
+            if coordinate is None:
+                return None
+
+            value_id = get_mapping(coordinate)
+            return get_value(value_id) if value_id is not None else None
+
+        return lookup
+
+    def _resolve_value(self, vector_value: Any, dimension_name: str) -> Optional[Any]:
+        """
+        Resolve a value through central axis -> coordinate mapping -> dimensional space.
+        Internal uncached lookup path.
+        """
+
+        # Resolve dimensional space and coordinate mapping in one probe
+        resolved = self._resolved_dimensions.get(dimension_name)
+        if resolved is None:
+            return None
+
         # Get coordinate from central axis
         coordinate = self.central_axis.get_coordinate(vector_value)
         if coordinate is None:
             return None
 
         # Get value_id from coordinate mapping
-        if dimension_name not in self.coordinate_mappings:
-            return None
+        space, mapping = resolved
 
-        value_id = self.coordinate_mappings[dimension_name].get_mapping(coordinate)
+        value_id = mapping.get_mapping(coordinate)
         if value_id is None:
             return None
 
         # Get value from dimensional space
-        if dimension_name not in self.dimensional_spaces:
-            return None
-        result = self.dimensional_spaces[dimension_name].get_value(value_id)
-
-        # Cache the result
-        if result is not None:
-            await self.cache_service.put(cache_key, result)
-
-        return result
+        return space.get_value(value_id)
 
     async def delete_coordinate(self, vector_value: Any) -> bool:
         """
@@ -159,12 +361,12 @@ class CoordinateService:
         # Get coordinate
         coordinate = self.central_axis.get_coordinate(vector_value)
         if coordinate is None:
-            logger.warning(f"Vector point {vector_value} not found for deletion")
+            logger.warning("Vector point %s not found for deletion", vector_value)
             return False
 
         # Invalidate all cache entries for this vector point
         for dimension_name in self.dimensional_spaces.keys():
-            cache_key = f"{vector_value}:{dimension_name}"
+            cache_key = (vector_value, dimension_name)
             await self.cache_service.invalidate(cache_key)
 
         # Clean up dimensional mappings and values
@@ -182,25 +384,54 @@ class CoordinateService:
                 # If no more references, remove the value from dimensional space
                 if ref_count == 0:
                     self.dimensional_spaces[dimension_name].remove_value_if_unused(value_id)
-                    logger.debug(f"Cleaned up unused value (ID {value_id}) from dimension '{dimension_name}'")
+                    logger.debug("Cleaned up unused value (ID %d) from dimension '%s'", value_id, dimension_name)
 
         # Tombstone in central axis (O(1) - no shifting)
         self.central_axis.remove_vector_point(vector_value)
 
-        logger.info(f"Deleted vector point '{vector_value}' at coordinate {coordinate}")
+        if self._record_ops:
+            self._pending_ops.append([OP_DELETE, vector_value])
+
+        logger.info("Deleted vector point '%s' at coordinate %d", vector_value, coordinate)
         return True
 
     async def save_database(self) -> bool:
         """
         Save database using async storage service.
         Coordinates between domain state and storage infrastructure.
+        Appends pending operations to the write-ahead log while it is small,
+        otherwise rewrites the full snapshot.
         """
 
+        ops, self._pending_ops = self._pending_ops, []
+
+        if ops and self._has_snapshot and not self.storage.should_compact():
+            if await self.storage.append_with_auto_metadata(ops, self.central_axis, self.dimensional_spaces):
+                return True
+
+            # Fall through to a full snapshot - it covers these operations and any applied during the append
+            ops, self._pending_ops = ops + self._pending_ops, []
+
+        elif not ops and self._has_snapshot:
+            return True
+
+        # Record from here on - operations applied while this snapshot is written must reach the next save
+        self._record_ops = True
+
         database_data = self.storage.serialize_database_structure(
             self.central_axis, self.dimensional_spaces, self.coordinate_mappings
         )
 
-        return await self.storage.save_with_auto_metadata(database_data, self.central_axis, self.dimensional_spaces)
+        saved = await self.storage.save_with_auto_metadata(database_data, self.central_axis, self.dimensional_spaces)
+
+        # True only once the new snapshot was swapped in
+        if saved:
+            self._has_snapshot = True
+
+        else:
+            self._pending_ops = ops + self._pending_ops
+
+        return saved
 
     async def load_database_structure(self):
         """
@@ -209,16 +440,26 @@ class CoordinateService:
         """
 
         database_data = await self.storage.load_database_structure()
-        if database_data is None:
-            return
+
+        if database_data is not None:
+            self._restore_database_structure(database_data)
+            self._has_snapshot = self._record_ops = True
+
+        await self._replay_deltas()
+
+    def _restore_database_structure(self, database_data: Dict[str, Any]):
+        """
+        Restore domain objects from a loaded snapshot.
+        Internal method for database loading.
+        """
 
         try:
             # Restore central axis
             axis_data = database_data.get("central_axis", {})
 
             self.central_axis.vector_points = axis_data.get("vector_points", [])
-            self.central_axis.coordinate_map = axis_data.get("coordinate_map", {})
             self.central_axis.free_slots = axis_data.get("free_slots", [])
+            self.central_axis.rebuild_coordinate_map()
 
             # Restore dimensional spaces
             spaces_data = database_data.get("dimensional_spaces", {})
@@ -226,8 +467,8 @@ class CoordinateService:
             for name, space_data in spaces_data.items():
                 space = DimensionalSpace(name)
 
-                # Convert string keys back to integers for value_domain
-                space.value_domain = {int(k): v for k, v in space_data.get("value_domain", {}).items()}
+                # MessagePack keeps the integer value IDs as map keys - no per-key conversion needed
+                space.value_domain = space_data.get("value_domain", {})
 
                 space.next_id = space_data.get("next_id", 1)
                 self.dimensional_spaces[name] = space
@@ -238,28 +479,60 @@ class CoordinateService:
             for name, mapping_data in mappings_data.items():
                 mapping = CoordinateMapping(name)
 
-                # Handle both old format (direct dict) and new format (nested with ref_counts)
-                if isinstance(mapping_data, dict) and "coordinate_to_value_id" in mapping_data:
+                # Handle the columnar format, the nested dict format with ref_counts and the old direct dict
+                if isinstance(mapping_data, dict) and "value_ids" in mapping_data:
+                    mapping.value_id_column = mapping_data["value_ids"]
+                    mapping.ref_counts = mapping_data.get("ref_counts", {})
+
+                elif isinstance(mapping_data, dict) and "coordinate_to_value_id" in mapping_data:
                     # New format with ref_counts
-                    mapping.coordinate_to_value_id = {
-                        int(k): v for k, v in mapping_data["coordinate_to_value_id"].items()
-                    }
-                    mapping.ref_counts = {int(k): v for k, v in mapping_data.get("ref_counts", {}).items()}
+                    mapping.coordinate_to_value_id = _int_keys(mapping_data["coordinate_to_value_id"])
+                    mapping.ref_counts = _int_keys(mapping_data.get("ref_counts", {}))
 
                 else:
                     # Old format - rebuild ref_counts from mappings
-                    mapping.coordinate_to_value_id = {int(k): v for k, v in mapping_data.items()}
+                    coordinate_to_value_id = _int_keys(mapping_data)
+                    mapping.coordinate_to_value_id = coordinate_to_value_id
 
-                    # Rebuild ref_counts
-                    for value_id in mapping.coordinate_to_value_id.values():
-                        mapping.ref_counts[value_id] = mapping.ref_counts.get(value_id, 0) + 1
+                    # Count from the loaded dict - reading the property back would rebuild it from the dense column
+                    mapping.ref_counts = dict(Counter(coordinate_to_value_id.values()))
 
                 self.coordinate_mappings[name] = mapping
 
             logger.info("Database loaded successfully from file")
 
         except Exception as e:
-            logger.error(f"Failed to load database: {e}")
+            logger.error("Failed to load database: %s", e)
+
+        finally:
+            self._rebuild_resolved_dimensions()
+
+    async def _replay_deltas(self):
+        """
+        Re-apply write-ahead log operations saved since the last snapshot.
+        Internal method for database loading.
+        """
+
+        replayed = 0
+
+        for ops in await self.storage.load_deltas():
+            for op in ops:
+                if op[0] == OP_UPSERT:
+                    await self.upsert_with_attributes(op[1], op[2], op[3])
+
+                elif op[0] == OP_DELETE:
+                    await self.delete_coordinate(op[1])
+
+                else:
+                    raise ValueError(f"Unknown write-ahead log operation {op[0]!r}")
+
+                replayed += 1
+
+        # Replayed operations are already in the log
+        self._pending_ops = []
+
+        if replayed:
+            logger.info("Replayed %d operations from write-ahead log", replayed)
 
     def get_database_statistics(self) -> Dict[str, Any]:
         """
@@ -280,21 +553,25 @@ class CoordinateService:
         )
 
     def get_all_vector_points_complete(self) -> List:
-        """Get all vector points with their complete attribute sets."""
-
-        points = []
+        """
+        Get all vector points with their complete attribute sets.
+        Delegates to a single columnar pass in CentralAxis.
+        """
 
-        for vector_value in self.central_axis.get_all_points():
-            point = self.get_vector_point_complete(vector_value)
+        return self.central_axis.get_all_vector_points_with_attributes(
+            self.dimensional_spaces, self.coordinate_mappings
+        )
 
-            if point:
-                points.append(point)
+    def get_dimensions_list(self) -> List[str]:
+        """
+        Get all dimensional space names.
+        Copies a cached tuple - the names are only re-read from the dimension dict after a dimension is added.
+        """
 
-        return points
+        if self._dimension_names is None:
+            self._dimension_names = tuple(self.dimensional_spaces)
 
-    def get_dimensions_list(self) -> List[str]:
-        """Get all dimensional space names."""
-        return list(self.dimensional_spaces.keys())
+        return list(self._dimension_names)
 
     def _add_dimension(self, dimension_name: str):
         """
@@ -303,7 +580,40 @@ class CoordinateService:
         """
 
         if dimension_name not in self.dimensional_spaces:
-            self.dimensional_spaces[dimension_name] = DimensionalSpace(dimension_name)
-            self.coordinate_mappings[dimension_name] = CoordinateMapping(dimension_name)
+            # Interned names let later dict probes match on identity - only str can be interned
+            if type(dimension_name) is str:
+                dimension_name = sys.intern(dimension_name)
+
+            space = DimensionalSpace(dimension_name)
+            mapping = CoordinateMapping(dimension_name)
+
+            self.dimensional_spaces[dimension_name] = space
+            self.coordinate_mappings[dimension_name] = mapping
+            self._resolved_dimensions[dimension_name] = (space, mapping)
+            self._dimension_names = None
+
+            logger.info("Added new dimension: '%s'", dimension_name)
+
+    def _ensure_dimension(self, dimension_name: str) -> Tuple[DimensionalSpace, CoordinateMapping]:
+        """
+        Create a dimension on first use and return its (space, mapping) pair.
+        Internal method for dimension management.
+        """
+
+        self._add_dimension(dimension_name)
+        return self._resolved_dimensions[dimension_name]
+
+    def _rebuild_resolved_dimensions(self):
+        """
+        Rebuild the dimension name -> (space, mapping) index after a bulk restore.
+        Internal method for dimension management.
+        """
+
+        intern = sys.intern
 
-            logger.info(f"Added new dimension: '{dimension_name}'")
+        self._dimension_names = None
+        self._resolved_dimensions = {
+            intern(name) if type(name) is str else name: (space, self.coordinate_mappings[name])
+            for name, space in self.dimensional_spaces.items()
+            if name in self.coordinate_mappings
+        }
@@ -7,11 +7,17 @@ from typing import Dict, Any, Optional, List
 from array import array
 
 import logging
+import sys
 
 from .vector_point import VectorPoint
 
+from ..mappings.coordinate_mapping import NO_VALUE
+
 logger = logging.getLogger(__name__)
 
+# Below one live point per this many slots, get_all_points sorts live keys instead of scanning
+SPARSE_AXIS_RATIO = 32
+
 
 class CentralAxis:
     """
@@ -34,6 +40,11 @@ class CentralAxis:
         """Set free_slots from list (for deserialization)."""
         self._free_slots = array("q", value)
 
+    @property
+    def free_slot_column(self) -> array:
+        """Get free_slots as the underlying int64 array (for bulk serialization)."""
+        return self._free_slots
+
     def add_vector_point(self, value: Any, position: Optional[int] = None) -> int:
         """
         Add a new vector point to the central axis.
@@ -50,6 +61,10 @@ class CentralAxis:
         if value in self.coordinate_map:
             return self.coordinate_map[value]
 
+        # Interned keys let later dict probes match on identity before falling back to __eq__
+        if type(value) is str:
+            value = sys.intern(value)
+
         if position is None:
             # Check for reusable tombstoned slots first
             if self._free_slots:
@@ -59,7 +74,7 @@ class CentralAxis:
                 self.vector_points[coordinate] = value
                 self.coordinate_map[value] = coordinate
 
-                logger.debug(f"Reused tombstoned slot {coordinate} for '{value}'")
+                logger.debug("Reused tombstoned slot %d for '%s'", coordinate, value)
                 return coordinate
 
             # No free slots - append to end
@@ -71,30 +86,96 @@ class CentralAxis:
             return coordinate
 
         else:
-            # Insert at specific position - requires shifting indices
+            # Insert at specific position - only points after it move, so only their indices are rewritten
+            position = max(0, min(position, len(self.vector_points)))
             self.vector_points.insert(position, value)
-            self.coordinate_map.clear()
 
-            for idx, point in enumerate(self.vector_points):
-                if point is not None:
-                    self.coordinate_map[point] = idx
+            self.coordinate_map[value] = position
+            self.coordinate_map.update(
+                (point, idx)
+                for idx, point in enumerate(self.vector_points[position + 1 :], start=position + 1)
+                if point is not None
+            )
+
+            # Shift all free_slots that are >= position - kept descending, so they form a prefix updated in place
+            free_slots = self._free_slots
+            idx = 0
 
-            # Shift all free_slots that are >= position
-            self._free_slots = array("q", [slot + 1 if slot >= position else slot for slot in self._free_slots])
+            while idx < len(free_slots) and free_slots[idx] >= position:
+                free_slots[idx] += 1
+                idx += 1
 
             return position
 
+    def add_vector_points_bulk(self, values: List[Any]) -> List[int]:
+        """
+        Add many new vector points in one pass, reusing tombstoned slots first (same LIFO order as add_vector_point).
+        The caller guarantees the values are distinct and not yet on the axis.
+
+        Args:
+            values: The new vector point values to add
+
+        Returns:
+            List[int]: The coordinate of each added point, in input order
+        """
+
+        intern = sys.intern
+        values = [intern(value) if type(value) is str else value for value in values]
+
+        free_slots = self._free_slots
+        reused = min(len(free_slots), len(values))
+        coordinates: List[int] = []
+
+        if reused:
+            # The highest free slots sit at the end - reversed, they match repeated pops
+            coordinates = free_slots[-reused:].tolist()[::-1]
+            del free_slots[-reused:]
+
+            for coordinate, value in zip(coordinates, values):
+                self.vector_points[coordinate] = value
+
+        start = len(self.vector_points)
+
+        self.vector_points.extend(values[reused:])
+        coordinates.extend(range(start, len(self.vector_points)))
+        self.coordinate_map.update(zip(values, coordinates))
+
+        return coordinates
+
+    def rebuild_coordinate_map(self):
+        """
+        Rebuild coordinate_map from vector_points after a bulk restore.
+        Every live point maps to its own index, so the map is never stored; string points are
+        interned so the list and the map share one key object and dict probes match on identity.
+        """
+
+        intern = sys.intern
+
+        self.vector_points = [intern(vp) if type(vp) is str else vp for vp in self.vector_points]
+        self.coordinate_map = {vp: coord for coord, vp in enumerate(self.vector_points) if vp is not None}
+
     def get_coordinate(self, value: Any) -> Optional[int]:
         """Get the coordinate index for a given vector point value."""
         return self.coordinate_map.get(value)
 
     def get_all_points(self) -> List[Any]:
         """Get all vector points in coordinate order (excluding deleted/None)."""
+
+        live = len(self.coordinate_map)
+
+        # No tombstones - a plain copy skips the per-element check
+        if live == len(self.vector_points):
+            return self.vector_points.copy()
+
+        # Mostly tombstones - ordering the live keys by coordinate beats scanning every dead slot
+        if live * SPARSE_AXIS_RATIO < len(self.vector_points):
+            return sorted(self.coordinate_map, key=self.coordinate_map.__getitem__)
+
         return [vp for vp in self.vector_points if vp is not None]
 
     def size(self) -> int:
         """Get the number of vector points in the central axis (excluding deleted/None)."""
-        return sum(1 for vp in self.vector_points if vp is not None)
+        return len(self.coordinate_map)  # Only live points are mapped - O(1)
 
     def remove_vector_point(self, value: Any) -> bool:
         """
@@ -118,7 +199,7 @@ class CentralAxis:
         # Remove from lookup map
         del self.coordinate_map[value]
 
-        logger.debug(f"Tombstoned vector point '{value}' at coordinate {coordinate}")
+        logger.debug("Tombstoned vector point '%s' at coordinate %d", value, coordinate)
 
         # Clean up trailing tombstones and update free_slots
         self._cleanup_trailing_tombstones()
@@ -147,7 +228,7 @@ class CentralAxis:
             except ValueError:
                 pass  # Not in array
 
-            logger.debug(f"Cleaned up trailing tombstone at coordinate {removed_coord}")
+            logger.debug("Cleaned up trailing tombstone at coordinate %d", removed_coord)
 
     def _add_free_slot(self, coordinate: int):
         """Add a coordinate to _free_slots in descending order."""
@@ -171,6 +252,8 @@ class CentralAxis:
         """
         Shift all coordinate mappings after insertion.
         Moved from main.py to follow DDD principles.
+        Each mapping is a contiguous int64 column, so this is one C-level memmove per dimension;
+        columns ending before from_position are skipped without copying.
         """
 
         for mapping in coordinate_mappings.values():
@@ -187,21 +270,56 @@ class CentralAxis:
             return None
 
         attributes = {}
+        get_space = dimensional_spaces.get
 
-        for dimension_name in dimensional_spaces:
-            if dimension_name not in coordinate_mappings:
+        # Column gather: one indexed read per dense mapping, spaces resolved with one probe only for mapped dimensions
+        for dimension_name, mapping in coordinate_mappings.items():
+            value_id = mapping.get_mapping(coordinate)
+            if value_id is None:
                 continue
 
-            value_id = coordinate_mappings[dimension_name].get_mapping(coordinate)
-            if value_id is None:
+            space = get_space(dimension_name)
+            if space is None:
                 continue
 
-            result = dimensional_spaces[dimension_name].get_value(value_id)
+            result = space.get_value(value_id)
 
             if result is not None:
                 attributes[dimension_name] = result
 
         return VectorPoint(coordinate, value, attributes)
 
+    def get_all_vector_points_with_attributes(self, dimensional_spaces, coordinate_mappings) -> List[VectorPoint]:
+        """
+        Get every live vector point with its dimensional attributes in one columnar pass.
+        Each mapping column is walked once instead of probing every dimension per point.
+        """
+
+        attributes: List[Optional[Dict[str, Any]]] = [None if vp is None else {} for vp in self.vector_points]
+        get_space = dimensional_spaces.get
+
+        for dimension_name, mapping in coordinate_mappings.items():
+            space = get_space(dimension_name)
+            if space is None:
+                continue
+
+            get_value = space.get_value
+
+            # Zip the point row with the raw column - no index arithmetic; zip stops at the shorter of the two
+            for attrs, value_id in zip(attributes, mapping.value_id_column):
+                if value_id == NO_VALUE or attrs is None:
+                    continue
+
+                result = get_value(value_id)
+
+                if result is not None:
+                    attrs[dimension_name] = result
+
+        return [
+            VectorPoint(coordinate, vp, attributes[coordinate])
+            for coordinate, vp in enumerate(self.vector_points)
+            if vp is not None
+        ]
+
     def __repr__(self) -> str:
         return f"CentralAxis(points={len(self.vector_points)})"
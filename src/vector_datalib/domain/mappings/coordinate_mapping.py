@@ -3,12 +3,19 @@ Coordinate Mapping - The f_axis(x_coordinate) functions that connect the central
 to dimensional spaces. These form the "propeller blades" radiating from the central hub.
 """
 
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+from array import array
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Value IDs start at 1, so 0 marks a coordinate without a mapping
+NO_VALUE = 0
+
+# Shared one-slot gap for the common single-coordinate shift (slice assignment copies it)
+_SINGLE_GAP = array("q", [NO_VALUE])
+
 
 class CoordinateMapping:
     """
@@ -18,8 +25,36 @@ class CoordinateMapping:
 
     def __init__(self, dimension_name: str):
         self.dimension_name = dimension_name
-        self.coordinate_to_value_id: Dict[int, int] = {}
+        self._value_ids: array = array("q")  # Dense int64 column indexed by coordinate
         self.ref_counts: Dict[int, int] = {}  # value_id -> reference count (O(1) lookups)
+        self.version = 0  # Bumped on every mutation so unchanged mappings can reuse their serialized form
+
+    @property
+    def coordinate_to_value_id(self) -> Dict[int, int]:
+        """Get mappings as dict (for serialization compatibility)."""
+        return dict(self.iter_mappings())
+
+    @coordinate_to_value_id.setter
+    def coordinate_to_value_id(self, data: Dict[int, int]):
+        """Set mappings from a dict (used during deserialization)."""
+
+        self._value_ids = array("q", bytes(8 * (max(data) + 1))) if data else array("q")
+        self.version += 1
+
+        for coord, value_id in data.items():
+            self._value_ids[coord] = value_id
+
+    @property
+    def value_id_column(self) -> array:
+        """Get the dense int64 value ID column (for bulk serialization)."""
+        return self._value_ids
+
+    @value_id_column.setter
+    def value_id_column(self, column: array):
+        """Set the dense int64 value ID column (used during deserialization)."""
+
+        self._value_ids = array("q", column)
+        self.version += 1
 
     def set_mapping(self, x_coordinate: int, value_id: int):
         """
@@ -31,18 +66,72 @@ class CoordinateMapping:
             value_id: The ID of the value in the dimensional space
         """
 
-        old_value_id = self.coordinate_to_value_id.get(x_coordinate)
+        extent = len(self._value_ids)
+
+        if x_coordinate == extent:
+            # Appending the next coordinate - grow in place using the array's own over-allocation
+            self._value_ids.append(NO_VALUE)
 
-        if old_value_id is not None and old_value_id != value_id:
+        elif x_coordinate > extent:
+            # Grow the column with empty slots up to the new coordinate in one resize
+            self._value_ids.frombytes(bytes(8 * (x_coordinate + 1 - extent)))
+
+        old_value_id = self._value_ids[x_coordinate]
+
+        # Already mapped to this value - its reference is already counted
+        if old_value_id == value_id:
+            return
+
+        if old_value_id != NO_VALUE:
             self.ref_counts[old_value_id] = self.ref_counts.get(old_value_id, 1) - 1
 
             if self.ref_counts[old_value_id] <= 0:
                 del self.ref_counts[old_value_id]
 
-        self.coordinate_to_value_id[x_coordinate] = value_id
+        self._value_ids[x_coordinate] = value_id
         self.ref_counts[value_id] = self.ref_counts.get(value_id, 0) + 1
+        self.version += 1
+
+        logger.debug("Set mapping %s[%d] = %d", self.dimension_name, x_coordinate, value_id)
+
+    def set_mappings(self, coordinates: List[int], value_ids: List[int]):
+        """
+        Set many coordinate -> value ID mappings at once.
+        Same result as calling set_mapping per pair, with the column grown in one resize.
+
+        Args:
+            coordinates: Coordinates in the central axis
+            value_ids: The value ID for each coordinate
+        """
+
+        if not coordinates:
+            return
+
+        column = self._value_ids
+        ref_counts = self.ref_counts
+        extent = max(coordinates) + 1
+
+        if extent > len(column):
+            column.frombytes(bytes(8 * (extent - len(column))))
+
+        for x_coordinate, value_id in zip(coordinates, value_ids):
+            old_value_id = column[x_coordinate]
+
+            if old_value_id == value_id:
+                continue
+
+            if old_value_id != NO_VALUE:
+                self._release(old_value_id)
+
+            column[x_coordinate] = value_id
+            ref_counts[value_id] = ref_counts.get(value_id, 0) + 1
+
+        self.version += 1
+        logger.debug("Set %d mappings in %s", len(coordinates), self.dimension_name)
 
-        logger.debug(f"Set mapping {self.dimension_name}[{x_coordinate}] = {value_id}")
+    def iter_mappings(self) -> Iterator[Tuple[int, int]]:
+        """Iterate (x_coordinate, value_id) pairs for every mapped coordinate in coordinate order."""
+        return ((coord, value_id) for coord, value_id in enumerate(self._value_ids) if value_id != NO_VALUE)
 
     def get_mapping(self, x_coordinate: int) -> Optional[int]:
         """
@@ -56,7 +145,13 @@ class CoordinateMapping:
             Optional[int]: The value ID, or None if no mapping exists
         """
 
-        return self.coordinate_to_value_id.get(x_coordinate)
+        if x_coordinate < len(self._value_ids):
+            value_id = self._value_ids[x_coordinate]
+
+            if value_id != NO_VALUE:
+                return value_id
+
+        return None
 
     def shift_coordinates(self, from_coordinate: int, shift_amount: int):
         """
@@ -68,20 +163,26 @@ class CoordinateMapping:
             shift_amount: How much to shift (+1 for insertion, -1 for deletion)
         """
 
-        if shift_amount == 0:
+        if shift_amount == 0 or from_coordinate >= len(self._value_ids):
             return
-        new_mapping = {}
 
-        for coord, value_id in self.coordinate_to_value_id.items():
-            if coord >= from_coordinate:
-                new_coord = coord + shift_amount
-                new_mapping[new_coord] = value_id
+        if shift_amount > 0:
+            # Open a gap of empty slots - a single memmove of the column tail
+            gap = _SINGLE_GAP if shift_amount == 1 else array("q", bytes(8 * shift_amount))
+            self._value_ids[from_coordinate:from_coordinate] = gap
+
+        else:
+            # Close the gap - slots overwritten by the shifted tail lose their references
+            start = max(0, from_coordinate + shift_amount)
 
-            else:
-                new_mapping[coord] = value_id
+            for value_id in self._value_ids[start:from_coordinate]:
+                if value_id != NO_VALUE:
+                    self._release(value_id)
 
-        self.coordinate_to_value_id = new_mapping
-        logger.debug(f"Shifted coordinates in {self.dimension_name} from {from_coordinate} by {shift_amount}")
+            del self._value_ids[start:from_coordinate]
+
+        self.version += 1
+        logger.debug("Shifted coordinates in %s from %d by %d", self.dimension_name, from_coordinate, shift_amount)
 
     def count_references_to_value(self, value_id: int) -> int:
         """Count how many coordinates reference a specific value ID."""
@@ -98,17 +199,29 @@ class CoordinateMapping:
             bool: True if mapping was removed, False if it didn't exist
         """
 
-        if x_coordinate in self.coordinate_to_value_id:
-            value_id = self.coordinate_to_value_id[x_coordinate]
-            self.ref_counts[value_id] = self.ref_counts.get(value_id, 1) - 1
+        value_id = self.get_mapping(x_coordinate)
+
+        if value_id is not None:
+            self._release(value_id)
+            self._value_ids[x_coordinate] = NO_VALUE
 
-            if self.ref_counts[value_id] <= 0:
-                del self.ref_counts[value_id]
+            # Trim trailing empty slots so the column tracks the live extent
+            while self._value_ids and self._value_ids[-1] == NO_VALUE:
+                self._value_ids.pop()
 
-            del self.coordinate_to_value_id[x_coordinate]
-            logger.debug(f"Removed mapping {self.dimension_name}[{x_coordinate}]")
+            self.version += 1
+
+            logger.debug("Removed mapping %s[%d]", self.dimension_name, x_coordinate)
             return True
         return False
 
+    def _release(self, value_id: int):
+        """Drop one reference to a value ID."""
+
+        self.ref_counts[value_id] = self.ref_counts.get(value_id, 1) - 1
+
+        if self.ref_counts[value_id] <= 0:
+            del self.ref_counts[value_id]
+
     def __repr__(self) -> str:
-        return f"CoordinateMapping(dimension='{self.dimension_name}', mappings={len(self.coordinate_to_value_id)})"
+        return f"CoordinateMapping(dimension='{self.dimension_name}', mappings={sum(self.ref_counts.values())})"
@@ -3,7 +3,7 @@ Dimensional Space - Represents attribute dimensions (Y, Z, J...) with value doma
 Each space contains unique values with deduplication for memory efficiency.
 """
 
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List, Tuple
 
 import logging
 
@@ -11,6 +11,71 @@ from bidict import bidict
 
 logger = logging.getLogger(__name__)
 
+# Attribute value types stored as they are - anything else goes through _freeze first
+PLAIN_VALUE_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+# Tags that keep frozen lists, tuples and dicts apart from each other and from plain tuples
+_LIST, _TUPLE, _DICT = object(), object(), object()
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Build a hashable key for a value storage can serialize, equal for values that are equal after a reload.
+    bytearray folds into bytes, since that is what it unpacks as.
+
+    Raises:
+        TypeError: If the value, or anything nested in it, can't be serialized
+    """
+
+    if isinstance(value, (str, int, float, bytes)) or value is None:
+        return value
+
+    if isinstance(value, bytearray):
+        return bytes(value)
+
+    if isinstance(value, list):
+        return (_LIST, tuple(map(_freeze, value)))
+
+    if isinstance(value, tuple):
+        return (_TUPLE, tuple(map(_freeze, value)))
+
+    if isinstance(value, dict):
+        return (_DICT, frozenset((_freeze(key), _freeze(item)) for key, item in value.items()))
+
+    raise TypeError(
+        f"Attribute values must be str, int, float, bool, bytes, None, list, tuple or dict, got {type(value).__name__}"
+    )
+
+
+def _thaw(key: Any) -> Any:
+    """Rebuild a detached value from a _freeze key - nested containers are fresh copies."""
+
+    # Frozen containers are the only tuples a key holds
+    if type(key) is not tuple:
+        return key
+
+    tag, items = key
+
+    if tag is _LIST:
+        return [_thaw(item) for item in items]
+
+    if tag is _TUPLE:
+        return tuple(_thaw(item) for item in items)
+
+    return {_thaw(name): _thaw(item) for name, item in items}
+
+
+def check_storable(value: Any):
+    """
+    Check that storage can serialize an attribute value, before anything is mutated.
+
+    Raises:
+        TypeError: If the value, or anything nested in it, can't be serialized
+    """
+
+    if type(value) not in PLAIN_VALUE_TYPES:
+        _freeze(value)
+
 
 class DimensionalSpace:
     """
@@ -21,17 +86,49 @@ class DimensionalSpace:
     def __init__(self, name: str):
         self.name = name
         self._values: bidict[int, Any] = bidict()
+        self._unhashable: Dict[int, Any] = {}  # id → value for lists, dicts and other unhashable values
+        self._unhashable_ids: Dict[Any, int] = {}  # _freeze key → id, the reverse index for _unhashable
         self.next_id = 1  # Auto-incrementing ID counter
+        self.version = 0  # Bumped on every mutation so unchanged spaces can reuse their serialized form
+        self._count = 0  # Unique values across both stores - avoids bidict's Python-level __len__
 
     @property
     def value_domain(self) -> Dict[int, Any]:
         """Forward lookup (id → value). Returns dict for serialization compatibility."""
-        return dict(self._values)
+
+        # The bidict's items view is its forward dict's own - copied at C speed, not through the Mapping protocol
+        domain = dict(self._values.items())
+
+        if self._unhashable:
+            domain.update(self._unhashable)
+
+        return domain
 
     @value_domain.setter
     def value_domain(self, data: Dict[int, Any]):
         """Set values from a dict (used during deserialization)."""
-        self._values = bidict(data)
+
+        self.version += 1
+
+        self._unhashable = {}
+        self._unhashable_ids = {}
+
+        try:
+            self._values = bidict(data)
+
+        except TypeError:
+            # Domain holds unhashable values - split them out of the bidict
+            self._values = bidict()
+
+            for value_id, value in data.items():
+                try:
+                    self._values[value_id] = value
+
+                except TypeError:
+                    self._unhashable[value_id] = value
+                    self._unhashable_ids[_freeze(value)] = value_id
+
+        self._count = len(self._values) + len(self._unhashable)
 
     def add_value(self, value: Any) -> int:
         """
@@ -43,30 +140,142 @@ class DimensionalSpace:
 
         Returns:
             int: The unique ID for this value in the domain
+
+        Raises:
+            TypeError: If storage can't serialize the value
         """
+
+        if type(value) not in PLAIN_VALUE_TYPES:
+            value, key = self._normalize(value)
+
+            if key is not None:
+                return self._add_unhashable_value(value, key)
+
         # Check if value already exists (O(1) reverse lookup)
-        if value in self._values.inverse:
-            return self._values.inverse[value]
+        existing_id = self._values.inverse.get(value)
+
+        if existing_id is not None:
+            return existing_id
 
         # Add new value to domain
         value_id = self.next_id
         self._values[value_id] = value
         self.next_id += 1
+        self.version += 1
+        self._count += 1
+
+        logger.debug("Added value '%s' to dimension '%s' with ID %d", value, self.name, value_id)
+        return value_id
+
+    def add_values(self, values: List[Any]) -> List[int]:
+        """
+        Add many values at once, deduplicating against the domain and within the batch.
+        Assigns the same IDs as calling add_value on each value in order, with the lookups bound once.
+
+        Args:
+            values: The values to add to the dimension
+
+        Returns:
+            List[int]: The ID of each value, in input order
+
+        Raises:
+            TypeError: If storage can't serialize one of the values
+        """
+
+        store = self._values
+        get_existing = store.inverse.get
+        value_ids = []
+        added = 0
+
+        for value in values:
+            if type(value) not in PLAIN_VALUE_TYPES:
+                value, key = self._normalize(value)
+
+                if key is not None:
+                    value_ids.append(self._add_unhashable_value(value, key))
+                    continue
+
+            value_id = get_existing(value)
+
+            if value_id is None:
+                value_id = self.next_id
+                store[value_id] = value
+                self.next_id += 1
+                added += 1
+
+            value_ids.append(value_id)
+
+        if added:
+            self.version += 1
+            self._count += added
+
+            logger.debug("Added %d values to dimension '%s'", added, self.name)
+
+        return value_ids
+
+    @staticmethod
+    def _normalize(value: Any) -> Tuple[Any, Optional[Any]]:
+        """
+        Detach a non-plain value into the form it reloads as (bytearray becomes bytes, containers are copied).
+        Returns (value, None) if the result is hashable, else (value, its _freeze key) for the unhashable store.
+        """
+
+        key = _freeze(value)
+        value = _thaw(key)
+
+        try:
+            hash(value)
+
+        except TypeError:
+            return value, key
+
+        return value, None
+
+    def _add_unhashable_value(self, value: Any, key: Any) -> int:
+        """Add an unhashable value, deduplicated in O(1) through its _freeze key."""
+
+        existing_id = self._unhashable_ids.get(key)
+        if existing_id is not None:
+            return existing_id
+
+        value_id = self.next_id
+        self._unhashable[value_id] = value
+        self._unhashable_ids[key] = value_id
+        self.next_id += 1
+        self.version += 1
+        self._count += 1
 
-        logger.debug(f"Added value '{value}' to dimension '{self.name}' with ID {value_id}")
+        logger.debug("Added unhashable value '%s' to dimension '%s' with ID %d", value, self.name, value_id)
         return value_id
 
     def get_value(self, value_id: int) -> Optional[Any]:
         """Get the value for a given ID in the value domain."""
-        return self._values.get(value_id)
+
+        value = self._values.get(value_id)
+
+        if value is None and self._unhashable:
+            return self._unhashable.get(value_id)
+
+        return value
 
     def get_value_id(self, value: Any) -> Optional[int]:
         """Get the ID for a given value in the value domain."""
+
+        if type(value) not in PLAIN_VALUE_TYPES:
+            try:
+                value, key = self._normalize(value)
+
+            except TypeError:
+                return None  # Storage can't hold it, so it was never added
+
+            if key is not None:
+                return self._unhashable_ids.get(key)
+
         return self._values.inverse.get(value)
 
     def get_value_count(self) -> int:
         """Get the number of unique values in this dimensional space."""
-        return len(self._values)
+        return self._count
 
     def remove_value_if_unused(self, value_id: int) -> bool:
         """
@@ -83,10 +292,17 @@ class DimensionalSpace:
             old_value = self._values[value_id]
             del self._values[value_id]  # bidict handles both directions
 
-            logger.debug(f"Removed unused value '{old_value}' (ID {value_id}) from dimension '{self.name}'")
-            return True
+        elif value_id in self._unhashable:
+            old_value = self._unhashable.pop(value_id)
+            del self._unhashable_ids[_freeze(old_value)]
+
+        else:
+            return False
 
-        return False
+        self.version += 1
+        self._count -= 1
+        logger.debug("Removed unused value '%s' (ID %d) from dimension '%s'", old_value, value_id, self.name)
+        return True
 
     def __repr__(self) -> str:
         return f"DimensionalSpace(name='{self.name}', values={self.get_value_count()})"
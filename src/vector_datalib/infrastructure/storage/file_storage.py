@@ -8,10 +8,21 @@ Uses LZ4 for blazing fast compression.
 import logging
 import msgpack
 import asyncio
+import threading
+import struct
+import mmap
+import time
+import zlib
+import sys
+import os
 
 import lz4.frame as lz4
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import islice
+from array import array
 from datetime import datetime
 from pathlib import Path
 
@@ -27,43 +38,465 @@ from ...meta import __version__
 
 logger = logging.getLogger(__name__)
 
+# Large lists/dicts are packed this many items at a time while streaming a save
+STREAM_CHUNK_SIZE = 1 << 14
+
+# Packed bytes are compressed as independent LZ4 frames of this size on worker threads.
+# Together with STREAM_CHUNK_SIZE this caps every pack/compress buffer at a few MB, so
+# buffer growth stays amortized and cheap - presized buffers measured no faster
+COMPRESS_CHUNK_SIZE = 4 << 20
+COMPRESS_WORKERS = min(4, os.cpu_count() or 1)
+
+# Packed dimension bytes kept between saves so unchanged dimensions skip re-packing.
+# Fragments with more than STREAM_CHUNK_SIZE container items are streamed in chunks and never cached;
+# smaller ones are cached up to PACK_CACHE_FRAGMENT_LIMIT each and PACK_CACHE_LIMIT in total
+PACK_CACHE_FRAGMENT_LIMIT = 1 << 20
+PACK_CACHE_LIMIT = 8 << 20
+
+# Storage jobs (snapshot save/load, log and header I/O) get their own pool, so they neither
+# queue behind unrelated default-executor work nor wait on compression workers they feed
+IO_WORKERS = 4
+
+_compress_pool: Optional[ThreadPoolExecutor] = None
+_io_pool: Optional[ThreadPoolExecutor] = None
+
+
+# Snapshot layout: magic, u32 metadata slot size, u32 CRC32 of the slot, zero-padded msgpack metadata, LZ4 body.
+# The fixed slot lets metadata be read or rewritten in place without touching the body.
+SNAPSHOT_MAGIC = b"VDB2"
+SNAPSHOT_HEADER = struct.Struct(">4sII")
+METADATA_SLOT_SIZE = 256
+
+# Earlier header without the slot checksum - still readable
+LEGACY_SNAPSHOT_MAGIC = b"VDB1"
+LEGACY_SNAPSHOT_HEADER = struct.Struct(">4sI")
+
+# File stat results are reused for this long (seconds) - saves and deletes invalidate them immediately
+STAT_CACHE_TTL = 0.05
+
+# Snapshot is rewritten once the write-ahead log grows past this fraction of it
+WAL_COMPACT_RATIO = 0.25
+
+# Write-ahead log record framing: u32 payload length and u32 CRC32 of the payload, then the msgpack payload
+WAL_RECORD_HEADER = struct.Struct(">II")
+
+# MessagePack ext types: typed arrays (typecode byte + little-endian raw items), tuples (packed item list)
+# and byte-plane arrays (typecode byte + plane mask byte + kept little-endian byte planes)
+ARRAY_EXT_TYPE = 1
+TUPLE_EXT_TYPE = 2
+ARRAY_PLANES_EXT_TYPE = 3
+
+
+def _split_planes(column: array) -> bytes:
+    """
+    Split a typed array into byte planes (byte k of every item, then byte k+1, ...), dropping all-zero planes.
+    Lossless for any values; small non-negative IDs leave most high planes empty and the grouped planes
+    compress far better than interleaved items.
+    """
+
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+
+    raw = column.tobytes()
+    width = column.itemsize
+    planes = []
+    mask = 0
+
+    for k in range(width):
+        plane = raw[k::width]
+
+        # The lowest plane is always kept so the item count survives an all-zero column
+        if k == 0 or plane.strip(b"\0"):
+            planes.append(plane)
+            mask |= 1 << k
+
+    return column.typecode.encode() + bytes((mask,)) + b"".join(planes)
+
+
+def _join_planes(data: bytes) -> array:
+    """Rebuild a typed array from the byte planes written by _split_planes."""
+
+    column = array(chr(data[0]))
+    width = column.itemsize
+    kept = [k for k in range(width) if data[1] >> k & 1]
+    count = (len(data) - 2) // len(kept)
+
+    raw = bytearray(width * count)
+    offset = 2
+
+    for k in kept:
+        raw[k::width] = data[offset : offset + count]
+        offset += count
+
+    column.frombytes(raw)
+
+    if sys.byteorder == "big":
+        column.byteswap()
+
+    return column
+
+
+def _encode_ext(obj: Any) -> Any:
+    """
+    Pack values msgpack has no exact type for (packing uses strict_types).
+    Typed arrays become byte planes instead of one msgpack int per item, tuples keep their
+    type so tuple keys stay hashable after a load, and builtin subclasses pack as their base type.
+    """
+
+    if isinstance(obj, array):
+        return msgpack.ExtType(ARRAY_PLANES_EXT_TYPE, _split_planes(obj))
+
+    if isinstance(obj, tuple):
+        return msgpack.ExtType(TUPLE_EXT_TYPE, msgpack.packb(list(obj), **_PACK_OPTIONS))
+
+    for base in (dict, list, str, bytes, int, float):
+        if isinstance(obj, base):
+            return base(obj)
+
+    raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+
+
+def _decode_ext(code: int, data: bytes) -> Any:
+    """Restore typed arrays and tuples packed by _encode_ext."""
+
+    if code == ARRAY_PLANES_EXT_TYPE:
+        return _join_planes(data)
+
+    if code == TUPLE_EXT_TYPE:
+        return tuple(msgpack.unpackb(data, **_UNPACK_OPTIONS))
+
+    if code != ARRAY_EXT_TYPE:
+        return msgpack.ExtType(code, data)
+
+    column = array(chr(data[0]))
+    column.frombytes(data[1:])
+
+    if sys.byteorder == "big":
+        column.byteswap()
+
+    return column
+
+
+_PACK_OPTIONS = {"use_bin_type": True, "strict_types": True, "default": _encode_ext}
+_UNPACK_OPTIONS = {"raw": False, "strict_map_key": False, "ext_hook": _decode_ext}
+
+
+# Data-only sync skips inode timestamp flushes where the platform supports it
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _fadvise(fd: int, advice: str):
+    """Pass a page-cache hint (os.POSIX_FADV_* name) for the whole file (no-op where unsupported)."""
+
+    if hasattr(os, "posix_fadvise") and hasattr(os, advice):
+        os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+
+
+def _fsync_directory(path: Path):
+    """Flush a directory entry so a rename into it survives a crash (no-op where unsupported)."""
+
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+
+    try:
+        os.fsync(fd)
+
+    finally:
+        os.close(fd)
+
+
+def _get_compress_pool() -> ThreadPoolExecutor:
+    """Lazy initialization of the shared compression thread pool."""
+
+    global _compress_pool
+
+    if _compress_pool is None:
+        _compress_pool = ThreadPoolExecutor(max_workers=COMPRESS_WORKERS, thread_name_prefix="vector-lz4")
+
+    return _compress_pool
+
+
+def _get_io_pool() -> ThreadPoolExecutor:
+    """Lazy initialization of the shared storage I/O thread pool."""
+
+    global _io_pool
+
+    if _io_pool is None:
+        _io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="vector-io")
+
+    return _io_pool
+
+
+def _reset_pools():
+    """Forget inherited pools in a forked child - their worker threads exist only in the parent."""
+
+    global _compress_pool, _io_pool
+    _compress_pool = _io_pool = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools)
+
+
+async def _run_in_io_pool(func: Callable[[], Any]) -> Any:
+    """Run a blocking storage job on the I/O pool from the running event loop."""
+    return await asyncio.get_running_loop().run_in_executor(_get_io_pool(), func)
+
+
+class _ParallelFrameWriter:
+    """
+    Write-only sink that compresses fixed-size chunks as independent LZ4 frames on worker threads.
+    LZ4 releases the GIL, so compression overlaps with packing; frames are written in order and
+    concatenated frames read back as one stream.
+    """
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._pool = _get_compress_pool()
+        self._buffer = bytearray()
+        self._in_flight = deque()
+
+    def write(self, data):
+        self._buffer += data
+
+        if len(self._buffer) >= COMPRESS_CHUNK_SIZE:
+            self._submit()
+
+    def close(self):
+        """Compress the remaining bytes and wait for every frame to be written."""
+
+        if self._buffer:
+            self._submit()
+
+        while self._in_flight:
+            self._raw.write(self._in_flight.popleft().result())
+
+    def _submit(self):
+        chunk, self._buffer = self._buffer, bytearray()
+
+        # 0 = fastest; one 4MB block per frame keeps per-block overhead low.
+        # The frame's xxHash32 content checksum is verified by the decompressor on load
+        self._in_flight.append(
+            self._pool.submit(
+                lz4.compress, chunk, compression_level=0, block_size=lz4.BLOCKSIZE_MAX4MB, content_checksum=True
+            )
+        )
+
+        # Drain finished frames, blocking once the in-flight window is full to bound memory
+        while self._in_flight and (len(self._in_flight) > COMPRESS_WORKERS or self._in_flight[0].done()):
+            self._raw.write(self._in_flight.popleft().result())
+
+
+def _pack_header(metadata: Dict[str, Any]) -> bytes:
+    """Build the snapshot header, padding the metadata to a whole number of slots."""
+
+    packed = msgpack.packb(metadata, **_PACK_OPTIONS)
+    slot_size = max(1, -(-len(packed) // METADATA_SLOT_SIZE)) * METADATA_SLOT_SIZE
+
+    slot = packed.ljust(slot_size, b"\0")
+
+    return SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, slot_size, zlib.crc32(slot)) + slot
+
+
+def _read_header(f) -> Tuple[Optional[Dict[str, Any]], int]:
+    """
+    Read the snapshot header from the start of an open file.
+    Returns (metadata, body offset); files written before the header existed give (None, 0).
+
+    Raises:
+        ValueError: If the metadata slot fails its checksum or doesn't decode
+    """
+
+    prefix = f.read(SNAPSHOT_HEADER.size)
+
+    if prefix[:4] == SNAPSHOT_MAGIC and len(prefix) == SNAPSHOT_HEADER.size:
+        _, slot_size, checksum = SNAPSHOT_HEADER.unpack(prefix)
+        body_offset = SNAPSHOT_HEADER.size + slot_size
+
+    elif prefix[:4] == LEGACY_SNAPSHOT_MAGIC and len(prefix) >= LEGACY_SNAPSHOT_HEADER.size:
+        _, slot_size = LEGACY_SNAPSHOT_HEADER.unpack_from(prefix)
+        body_offset = LEGACY_SNAPSHOT_HEADER.size + slot_size
+        checksum = None
+
+        f.seek(LEGACY_SNAPSHOT_HEADER.size)
+
+    else:
+        return None, 0
+
+    slot = f.read(slot_size)
+
+    # checkpoint_tid lives here - a damaged slot must never load as default metadata
+    if len(slot) < slot_size or (checksum is not None and zlib.crc32(slot) != checksum):
+        raise ValueError("metadata header failed its checksum")
+
+    unpacker = msgpack.Unpacker(**_UNPACK_OPTIONS)
+    unpacker.feed(slot)
+
+    try:
+        metadata = unpacker.unpack()
+
+    except (ValueError, msgpack.UnpackException) as e:
+        raise ValueError(f"metadata header doesn't decode: {e}") from e
+
+    if not isinstance(metadata, dict):
+        raise ValueError("metadata header doesn't decode to a map")
+
+    return metadata, body_offset
+
+
+class _Packed(bytes):
+    """Already-serialized MessagePack bytes, written to the stream verbatim."""
+
+
+class _Fragment:
+    """
+    Deferred branch of a snapshot tied to a versioned domain object.
+    Built as a private copy on the event loop, packed in the worker thread
+    and reused across saves while the source's version is unchanged.
+    """
+
+    __slots__ = ("key", "source", "version", "build")
+
+    def __init__(self, key: Tuple[str, str], source: Any, build: Callable[[], Any]):
+        self.key = key
+        self.source = source
+        self.version = source.version
+        self.build = build
+
+
+def _container_header_size(length: int) -> int:
+    """Size of a MessagePack array/map header for a container of the given length."""
+
+    if length <= 0xF:
+        return 1
+
+    return 3 if length <= 0xFFFF else 5
+
+
+def _container_items(data: Dict[str, Any]) -> int:
+    """Number of list and dict items directly inside a fragment's data - a size estimate that needs no packing."""
+    return sum(len(value) for value in data.values() if isinstance(value, (dict, list)))
+
+
+def _stream_pack(write, packer: msgpack.Packer, obj: Any):
+    """
+    Pack obj through write() in bounded pieces.
+    Dicts are walked key by key; large lists and dicts are emitted as one header
+    followed by chunk-sized runs of items, each packed in C with its header stripped.
+    """
+
+    if isinstance(obj, _Packed):
+        write(obj)
+
+    elif isinstance(obj, dict) and (
+        len(obj) <= STREAM_CHUNK_SIZE or isinstance(next(iter(obj.values())), (_Packed, dict))
+    ):
+        # Small dicts and dicts of fragments (pre-packed or streamed) are walked key by key
+        write(packer.pack_map_header(len(obj)))
+
+        for key, value in obj.items():
+            write(packer.pack(key))
+            _stream_pack(write, packer, value)
+
+    elif isinstance(obj, dict):
+        write(packer.pack_map_header(len(obj)))
+        items = iter(obj.items())
+
+        for _ in range(0, len(obj), STREAM_CHUNK_SIZE):
+            chunk = dict(islice(items, STREAM_CHUNK_SIZE))
+            write(memoryview(packer.pack(chunk))[_container_header_size(len(chunk)) :])
+
+    elif isinstance(obj, list) and len(obj) > STREAM_CHUNK_SIZE:
+        write(packer.pack_array_header(len(obj)))
+
+        for start in range(0, len(obj), STREAM_CHUNK_SIZE):
+            chunk = obj[start : start + STREAM_CHUNK_SIZE]
+            write(memoryview(packer.pack(chunk))[_container_header_size(len(chunk)) :])
+
+    else:
+        write(packer.pack(obj))
+
 
 class VectorFileStorage:
     """Async-first single-file storage system for Vector Database."""
 
     def __init__(self, file_path: str):
         self.file_path = Path(file_path)
+        # Append-only delta log next to the snapshot - the full name is kept so x.db and x.dat get separate logs
+        self.wal_path = self.file_path.with_name(self.file_path.name + ".wal")
         self._async_lock = None  # Lazy init for async lock
 
+        # Held by worker threads around in-place header rewrites and the lock-free load's header read
+        self._header_lock = threading.Lock()
+
+        # (monotonic time, stat result or None if missing) from the last stat of the snapshot
+        self._stat_cache: Tuple[float, Optional[os.stat_result]] = (float("-inf"), None)
+
+        # Fragment key -> (source, version, packed bytes) from the last snapshot
+        self._pack_cache: Dict[Tuple[str, str], Tuple[Any, int, _Packed]] = {}
+
+        # Highest WAL sequence number handed out or seen on disk - appends continue after it.
+        # Persisted through the record tids and the header checkpoint, so it never depends on the clock
+        self._last_tid = 0
+
         self.metadata = {
             "version": __version__,
             "created_at": None,
             "last_modified": None,
             "total_vector_points": 0,
             "total_dimensions": 0,
+            "checkpoint_tid": 0,  # WAL records at or before this are already in the snapshot
         }
 
+    def _stat(self) -> Optional[os.stat_result]:
+        """Stat the snapshot at most once per STAT_CACHE_TTL - None if it doesn't exist."""
+
+        checked_at, result = self._stat_cache
+        now = time.monotonic()
+
+        if now - checked_at < STAT_CACHE_TTL:
+            return result
+
+        try:
+            result = os.stat(self.file_path)
+
+        except FileNotFoundError:
+            result = None
+
+        self._stat_cache = (now, result)
+        return result
+
+    def _invalidate_stat(self):
+        """Drop the cached stat result after the snapshot changed."""
+        self._stat_cache = (float("-inf"), None)
+
     def _get_async_lock(self):
         """Lazy initialization of async lock."""
         if self._async_lock is None:
             self._async_lock = asyncio.Lock()
         return self._async_lock
 
-    async def save_database(self, database_data: Dict[str, Any]) -> bool:
+    async def save_database(
+        self, database_data: Dict[str, Any], metadata_updates: Optional[Dict[str, Any]] = None
+    ) -> bool:
         """
         Save the complete vector database to file asynchronously.
-        Uses MessagePack for efficient binary serialization.
+        Uses MessagePack for efficient binary serialization, streamed through
+        the compressor so peak memory stays at one chunk instead of the whole snapshot.
+        The snapshot is written to a temp file, fsynced and atomically swapped in.
+        Metadata goes to an uncompressed fixed-size header ahead of the compressed body.
 
         Args:
             database_data: Complete serialized database structure
+            metadata_updates: Header fields that only apply to this snapshot - kept once it is swapped in
 
         Returns:
             bool: True if save succeeded
         """
 
-        if not AIOFILES_AVAILABLE:
-            raise ImportError("aiofiles is required for async operations. Install with: pip install aiofiles")
-
         try:
             now = datetime.now().isoformat()
 
@@ -72,135 +505,473 @@ class VectorFileStorage:
 
             self.metadata["last_modified"] = now
 
-            complete_data = {"metadata": self.metadata, "database": database_data}
+            # Kept out of self.metadata until the swap - an in-place rewrite of the old header would carry it
+            header = _pack_header({**self.metadata, **(metadata_updates or {})})
 
-            # Convert coordinate_map to list of tuples to preserve mixed-type keys
-            if "database" in complete_data and "central_axis" in complete_data["database"]:
-                coord_map = complete_data["database"]["central_axis"].get("coordinate_map", {})
-                complete_data["database"]["central_axis"]["coordinate_map"] = list(coord_map.items())
+            # Resolved on the event loop before the first await - writers can't change the snapshot mid-pack
+            pack_cache, pending = self._resolve_fragments(database_data)
 
-            # Serialize in thread pool to avoid blocking event loop
-            loop = asyncio.get_event_loop()
+            def _stream_to_file():
+                packer = msgpack.Packer(**_PACK_OPTIONS)
+                self._pack_fragments(pack_cache, pending, packer)
+                tmp_path = self.file_path.with_suffix(self.file_path.suffix + ".tmp")
 
-            def _packb():
-                return msgpack.packb(complete_data, use_bin_type=True)
+                # Create parent directory if needed - in the same worker job as the write, sync and swap
+                self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            msgpack_data = await loop.run_in_executor(None, _packb)
+                try:
+                    with open(tmp_path, "wb") as raw:
+                        raw.write(header)
 
-            def _compress():
-                return lz4.compress(msgpack_data, compression_level=0)  # 0 = fastest
+                        sink = _ParallelFrameWriter(raw)
+                        _stream_pack(sink.write, packer, database_data)
+                        sink.close()
 
-            compressed_data = await loop.run_in_executor(None, _compress)
+                        raw.flush()
+                        _fdatasync(raw.fileno())
 
-            # Create parent directory if needed
-            await aiofiles.os.makedirs(self.file_path.parent, exist_ok=True)
+                        # Pages are clean after the sync - drop them instead of evicting hotter data
+                        _fadvise(raw.fileno(), "POSIX_FADV_DONTNEED")
 
-            # Write file with async lock
+                    # Atomic swap - readers see either the old or the new snapshot, never a partial one
+                    os.replace(tmp_path, self.file_path)
+                    _fsync_directory(self.file_path.parent)
+
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+
+            # Pack, compress, write and swap in thread pool with async lock - no full in-memory copy of the snapshot
             async with self._get_async_lock():
-                async with aiofiles.open(self.file_path, "wb") as f:
-                    await f.write(compressed_data)
+                try:
+                    await _run_in_io_pool(_stream_to_file)
+
+                    if metadata_updates:
+                        self.metadata.update(metadata_updates)
 
-            logger.info(f"Vector database saved to {self.file_path}")
+                finally:
+                    self._invalidate_stat()
+
+            logger.info("Vector database saved to %s", self.file_path)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to save vector database: {e}")
+            logger.error("Failed to save vector database: %s", e)
             return False
 
+    def _resolve_fragments(self, database_data: Dict[str, Any]) -> Tuple[Dict[Tuple[str, str], Any], List[Any]]:
+        """
+        Replace deferred fragments with the last snapshot's packed bytes where the source hasn't changed,
+        and build private copies of the rest for the worker to pack. Runs on the event loop thread.
+
+        Returns:
+            Tuple: The new pack cache (reused entries only) and the (branch, name, fragment, data) left to pack
+        """
+
+        pack_cache = {}
+        pending = []
+
+        for section in ("dimensional_spaces", "coordinate_mappings"):
+            branch = database_data.get(section, {})
+
+            for name, fragment in branch.items():
+                if not isinstance(fragment, _Fragment):
+                    continue
+
+                cached = self._pack_cache.get(fragment.key)
+
+                if cached is not None and cached[0] is fragment.source and cached[1] == fragment.version:
+                    pack_cache[fragment.key] = cached
+                    branch[name] = cached[2]
+
+                else:
+                    pending.append((branch, name, fragment, fragment.build()))
+
+        return pack_cache, pending
+
+    def _pack_fragments(self, pack_cache: Dict[Tuple[str, str], Any], pending: List[Any], packer: msgpack.Packer):
+        """
+        Pack the fragments left by _resolve_fragments (in the worker thread) and install the new pack cache.
+        Large fragments are left as data for _stream_pack to write in chunks; the cache stays under PACK_CACHE_LIMIT.
+        """
+
+        cached_size = sum(len(entry[2]) for entry in pack_cache.values())
+
+        for branch, name, fragment, data in pending:
+            # Too big to pack in one buffer - streamed straight into the snapshot and re-packed next save
+            if _container_items(data) > STREAM_CHUNK_SIZE:
+                branch[name] = data
+                continue
+
+            packed = _Packed(packer.pack(data))
+            branch[name] = packed
+
+            if len(packed) <= PACK_CACHE_FRAGMENT_LIMIT and cached_size + len(packed) <= PACK_CACHE_LIMIT:
+                pack_cache[fragment.key] = (fragment.source, fragment.version, packed)
+                cached_size += len(packed)
+
+        # Only fragments of the current snapshot are kept - dropped dimensions release their bytes
+        self._pack_cache = pack_cache
+
     async def load_database(self) -> Optional[Dict[str, Any]]:
         """
         Load the vector database from file asynchronously.
         Uses MessagePack for efficient binary deserialization.
+        The file is memory-mapped and streamed through the decompressor into the unpacker,
+        so neither the compressed nor the decompressed payload is copied into memory whole.
+        Lock-free: concurrent loads run in parallel and never wait on a save.
 
         Returns:
             Optional[Dict]: Database data if load succeeded, None otherwise
-        """
 
-        if not AIOFILES_AVAILABLE:
-            raise ImportError("aiofiles is required for async operations. Install with: pip install aiofiles")
+        Raises:
+            ValueError: If the snapshot fails its checksum or is truncated
+        """
 
         try:
-            if not self.file_path.exists():
-                logger.info(f"Database file {self.file_path} does not exist")
-                return None
 
-            # Read file with async lock
-            async with self._get_async_lock():
-                async with aiofiles.open(self.file_path, "rb") as f:
-                    compressed_data = await f.read()
+            def _stream_from_file():
+                try:
+                    f = open(self.file_path, "rb")
+
+                except FileNotFoundError:
+                    return None
+
+                with f:
+                    # An empty file has no snapshot to map - same as a missing one
+                    if os.fstat(f.fileno()).st_size == 0:
+                        return None
+
+                    # The body is read front to back once - ask for aggressive readahead on the file and the mapping
+                    _fadvise(f.fileno(), "POSIX_FADV_SEQUENTIAL")
+
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                            mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+                        try:
+                            # Never read mid-rewrite - a half-written slot would fail its checksum
+                            with self._header_lock:
+                                metadata, body_offset = _read_header(mapped)
+
+                        except ValueError as e:
+                            raise ValueError(f"Database file {self.file_path} is corrupted: {e}") from e
+
+                        mapped.seek(body_offset)
+
+                        try:
+                            with lz4.LZ4FrameFile(mapped) as stream:
+                                body = msgpack.Unpacker(stream, **_UNPACK_OPTIONS).unpack()
 
-            loop = asyncio.get_event_loop()
-            msgpack_data = await loop.run_in_executor(None, lz4.decompress, compressed_data)
+                        except (RuntimeError, EOFError, ValueError, msgpack.UnpackException) as e:
+                            # Frame checksum mismatch or truncated body - never hand back a partial database
+                            raise ValueError(f"Database file {self.file_path} is corrupted: {e}") from e
 
-            def _unpackb():
-                return msgpack.unpackb(msgpack_data, raw=False, strict_map_key=False)
+                # Files without a header keep metadata inside the compressed body
+                if metadata is None:
+                    return body.get("metadata"), body.get("database", {})
 
-            complete_data = await loop.run_in_executor(None, _unpackb)
+                return metadata, body
 
-            self.metadata = complete_data.get("metadata", self.metadata)
-            database_data = complete_data.get("database", {})
+            # Map, decompress and unpack in thread pool - decompressed bytes are never fully buffered.
+            # No lock: saves swap in a new inode, and in-place header rewrites never touch the body
+            loaded = await _run_in_io_pool(_stream_from_file)
 
-            # Convert coordinate_map back from list of tuples to dict
+            # Opening is the existence check - no separate stat, and no window for the file to vanish in between
+            if loaded is None:
+                logger.info("Database file %s does not exist", self.file_path)
+                return None
+
+            metadata, database_data = loaded
+
+            self.metadata = metadata or self.metadata
+            self._last_tid = max(self._last_tid, self.metadata.get("checkpoint_tid", 0))
+
+            # Older files stored coordinate_map as a list of tuples - convert back to dict
             if "central_axis" in database_data:
                 coord_map_list = database_data["central_axis"].get("coordinate_map", [])
 
                 if isinstance(coord_map_list, list):
                     database_data["central_axis"]["coordinate_map"] = dict(coord_map_list)
 
-            logger.info(f"Vector database loaded from {self.file_path}")
+            logger.info("Vector database loaded from %s", self.file_path)
             return database_data
 
+        except ValueError as e:
+            # Surface corruption instead of loading an empty database that the next save would persist
+            logger.error("Failed to load vector database: %s", e)
+            raise
+
         except Exception as e:
-            logger.error(f"Failed to load vector database: {e}")
+            logger.error("Failed to load vector database: %s", e)
             return None
 
-    async def exists(self) -> bool:
-        """Check if database file exists asynchronously."""
+    async def append_delta(self, ops: List[Any]) -> bool:
+        """
+        Append a batch of operations to the write-ahead log asynchronously.
+        Only the changes since the last save are written - the snapshot is left untouched.
 
-        if not AIOFILES_AVAILABLE:
-            return self.file_path.exists()
+        Args:
+            ops: Operation records to replay on top of the snapshot at load time
+
+        Returns:
+            bool: True if append succeeded
+        """
+
+        try:
+            # Taken before the first await, so sequence order matches the order the operations were applied
+            self._last_tid += 1
+            payload = msgpack.packb({"tid": self._last_tid, "ops": ops}, **_PACK_OPTIONS)
+            record = WAL_RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+            def _append():
+                # Unbuffered - a failed write leaves nothing queued to be flushed again on close
+                with open(self.wal_path, "ab", buffering=0) as f:
+                    offset = f.seek(0, 2)
+
+                    try:
+                        view = memoryview(record)
+
+                        while view:
+                            view = view[f.write(view) :]
+
+                    except BaseException:
+                        # Cut the partial record off so the next append starts on a record boundary
+                        f.truncate(offset)
+                        raise
+
+            # Append in thread pool with async lock
+            async with self._get_async_lock():
+                await _run_in_io_pool(_append)
+
+            logger.debug("Appended %d operations to %s", len(ops), self.wal_path)
+            return True
+
+        except Exception as e:
+            logger.error("Failed to append to write-ahead log: %s", e)
+            return False
+
+    async def load_deltas(self) -> List[List[Any]]:
+        """
+        Load operation batches from the write-ahead log asynchronously.
+        Batches already folded into the snapshot are skipped, and a torn trailing
+        record from an interrupted append is cut off so later appends stay readable.
+
+        Returns:
+            List: Operation batches in append order
+
+        Raises:
+            ValueError: If a record before the end of the log fails its checksum or doesn't decode
+            OSError: If the log exists but can't be read
+        """
+
+        checkpoint_tid = self.metadata.get("checkpoint_tid", 0)
+
+        def _read():
+            if not self.wal_path.exists():
+                return []
+
+            with open(self.wal_path, "rb+") as f:
+                # Bounded by WAL_COMPACT_RATIO of the snapshot - read whole
+                data = f.read()
+                batches = []
+                valid_end = 0
+
+                while valid_end + WAL_RECORD_HEADER.size <= len(data):
+                    length, checksum = WAL_RECORD_HEADER.unpack_from(data, valid_end)
+                    start = valid_end + WAL_RECORD_HEADER.size
+                    end = start + length
+
+                    # Short final record - an interrupted append
+                    if end > len(data):
+                        break
+
+                    payload = data[start:end]
+
+                    if zlib.crc32(payload) != checksum:
+                        # Only the final record can be torn - damage anywhere else is corruption
+                        if end == len(data):
+                            break
+
+                        raise ValueError(f"Write-ahead log {self.wal_path} is corrupted at offset {valid_end}")
+
+                    try:
+                        record = msgpack.unpackb(payload, **_UNPACK_OPTIONS)
+                        tid, record_ops = record["tid"], record["ops"]
+
+                    except (ValueError, TypeError, KeyError, msgpack.UnpackException) as e:
+                        raise ValueError(
+                            f"Write-ahead log {self.wal_path} is corrupted at offset {valid_end}: {e}"
+                        ) from e
+
+                    valid_end = end
+                    self._last_tid = max(self._last_tid, tid)
+
+                    if tid > checkpoint_tid:
+                        batches.append(record_ops)
+
+                if valid_end < len(data):
+                    logger.warning("Discarding torn record at offset %d of %s", valid_end, self.wal_path)
+                    f.truncate(valid_end)
 
-        return await aiofiles.os.path.exists(self.file_path)
+            return batches
+
+        try:
+            async with self._get_async_lock():
+                return await _run_in_io_pool(_read)
+
+        except Exception as e:
+            # Never return an empty log on failure - the next compaction would delete the unread records
+            logger.error("Failed to load write-ahead log: %s", e)
+            raise
+
+    def should_compact(self) -> bool:
+        """Check whether the next save should rewrite the snapshot instead of appending to the log."""
+
+        snapshot = self._stat()
+        if snapshot is None:
+            return True
+
+        try:
+            wal_size = os.stat(self.wal_path).st_size
+
+        except FileNotFoundError:
+            wal_size = 0
+
+        return wal_size > snapshot.st_size * WAL_COMPACT_RATIO
+
+    async def compact(self, database_data: Dict[str, Any]) -> bool:
+        """
+        Fold the write-ahead log into a fresh snapshot asynchronously.
+        The log is only emptied once the snapshot write has succeeded, and only
+        if nothing was appended while the snapshot was being written.
+
+        Args:
+            database_data: Complete serialized database structure
+
+        Returns:
+            bool: True if compaction succeeded
+        """
+
+        # Every record appended so far is already applied to the state being saved
+        checkpoint_tid = self._last_tid
+
+        if not await self.save_database(database_data, {"checkpoint_tid": checkpoint_tid}):
+            return False
+
+        try:
+            async with self._get_async_lock():
+                # Later records aren't in the snapshot - keep the log, the checkpoint skips the rest on load
+                if self._last_tid != checkpoint_tid:
+                    return True
+
+                # Same I/O pool as the snapshot write - doesn't depend on aiofiles
+                await _run_in_io_pool(lambda: self.wal_path.unlink(missing_ok=True))
+
+            return True
+
+        except Exception as e:
+            # Stale records are skipped on load via checkpoint_tid
+            logger.error("Failed to reset write-ahead log: %s", e)
+            return True
+
+    async def exists(self) -> bool:
+        """Check if database file exists asynchronously."""
+        return self._stat() is not None
 
     async def delete(self) -> bool:
         """Delete database file asynchronously."""
 
+        self._invalidate_stat()
+
         if not AIOFILES_AVAILABLE:
             try:
+                self.wal_path.unlink(missing_ok=True)
+
                 if self.file_path.exists():
                     self.file_path.unlink()
-                    logger.info(f"Deleted database file {self.file_path}")
+                    self._invalidate_stat()
+
+                    logger.info("Deleted database file %s", self.file_path)
                 return True
 
             except Exception as e:
-                logger.error(f"Failed to delete database file: {e}")
+                logger.error("Failed to delete database file: %s", e)
                 return False
 
         try:
+            if await aiofiles.os.path.exists(self.wal_path):
+                await aiofiles.os.remove(self.wal_path)
+
             if await self.exists():
                 await aiofiles.os.remove(self.file_path)
-                logger.info(f"Deleted database file {self.file_path}")
+                self._invalidate_stat()
+
+                logger.info("Deleted database file %s", self.file_path)
                 return True
 
             return False
 
         except Exception as e:
-            logger.error(f"Failed to delete database file: {e}")
+            logger.error("Failed to delete database file: %s", e)
             return False
 
     def get_file_size(self) -> int:
         """Get the size of the database file in bytes."""
 
-        if self.file_path.exists():
-            return self.file_path.stat().st_size
-
-        return 0
+        result = self._stat()
+        return result.st_size if result is not None else 0
 
     def get_metadata(self) -> Dict[str, Any]:
         """Get database metadata."""
 
         return self.metadata.copy()
 
+    def read_metadata(self) -> Optional[Dict[str, Any]]:
+        """
+        Read metadata straight from the snapshot header, without loading or decompressing the body.
+
+        Returns:
+            Optional[Dict]: Stored metadata, or None if the file is missing or predates the header
+        """
+
+        try:
+            with open(self.file_path, "rb") as f:
+                return _read_header(f)[0]
+
+        except (OSError, ValueError, msgpack.UnpackException) as e:
+            logger.debug("Could not read metadata header from %s - %s", self.file_path, e)
+            return None
+
+    async def write_metadata(self) -> bool:
+        """
+        Rewrite the snapshot's metadata header in place asynchronously.
+        Only the fixed-size header is written - the compressed body is left untouched.
+
+        Returns:
+            bool: True if the header was rewritten, False if it no longer fits its slot or the file predates it
+        """
+
+        header = _pack_header(self.metadata)
+
+        def _rewrite():
+            with open(self.file_path, "r+b") as f, self._header_lock:
+                if _read_header(f)[1] != len(header):
+                    return False
+
+                f.seek(0)
+                f.write(header)
+                f.flush()
+                return True
+
+        try:
+            async with self._get_async_lock():
+                return await _run_in_io_pool(_rewrite)
+
+        except Exception as e:
+            logger.error("Failed to rewrite metadata header: %s", e)
+            return False
+
     def update_metadata(self, updates: Dict[str, Any]):
         """Update database metadata."""
 
@@ -210,23 +981,34 @@ class VectorFileStorage:
         """
         Serialize the complete database structure.
         Moved from main.py to follow DDD principles.
+        Int64 columns (free slots, mapping value IDs) are packed as raw array buffers;
+        coordinate_map is omitted since it is rebuilt from vector_points on load.
+        Dimensions are deferred fragments so unchanged ones reuse their bytes from the last snapshot.
         """
 
         return {
+            # Copies, not live references - the worker packs them while writers keep running on the event loop
             "central_axis": {
-                "vector_points": central_axis.vector_points,
-                "coordinate_map": central_axis.coordinate_map,
-                "free_slots": central_axis.free_slots,
+                "vector_points": list(central_axis.vector_points),
+                "free_slots": array("q", central_axis.free_slot_column),
             },
             "dimensional_spaces": {
-                name: {"value_domain": space.value_domain, "next_id": space.next_id}
+                name: _Fragment(
+                    ("space", name),
+                    space,
+                    lambda space=space: {"value_domain": space.value_domain, "next_id": space.next_id},
+                )
                 for name, space in dimensional_spaces.items()
             },
             "coordinate_mappings": {
-                name: {
-                    "coordinate_to_value_id": mapping.coordinate_to_value_id,
-                    "ref_counts": mapping.ref_counts,
-                }
+                name: _Fragment(
+                    ("mapping", name),
+                    mapping,
+                    lambda mapping=mapping: {
+                        "value_ids": array("q", mapping.value_id_column),
+                        "ref_counts": dict(mapping.ref_counts),
+                    },
+                )
                 for name, mapping in coordinate_mappings.items()
             },
         }
@@ -251,16 +1033,39 @@ class VectorFileStorage:
             "metadata": self.get_metadata(),
         }
 
+    async def append_with_auto_metadata(self, ops: List[Any], central_axis, dimensional_spaces) -> bool:
+        """
+        Append operations to the write-ahead log and refresh the snapshot's metadata header asynchronously.
+        """
+
+        if not await self.append_delta(ops):
+            return False
+
+        self.update_metadata(
+            {
+                "last_modified": datetime.now().isoformat(),
+                "total_vector_points": central_axis.size(),
+                "total_dimensions": len(dimensional_spaces),
+            }
+        )
+
+        # Stale header counts are harmless - the next snapshot rewrites them
+        await self.write_metadata()
+        return True
+
     async def save_with_auto_metadata(self, database_data: Dict[str, Any], central_axis, dimensional_spaces) -> bool:
         """
         Save database with automatic metadata updates asynchronously.
+        Writes a fresh snapshot and resets the write-ahead log.
         """
 
         self.update_metadata({"total_vector_points": central_axis.size(), "total_dimensions": len(dimensional_spaces)})
-        return await self.save_database(database_data)
+        return await self.compact(database_data)
 
     def __repr__(self) -> str:
-        size = self.get_file_size()
-        exists = "exists" if self.file_path.exists() else "not found"
+        result = self._stat()
+
+        size = result.st_size if result is not None else 0
+        exists = "exists" if result is not None else "not found"
 
         return f"VectorFileStorage(path='{self.file_path}', {exists}, {size} bytes)"